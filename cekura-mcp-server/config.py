@@ -1,6 +1,6 @@
 import os
-from typing import Optional, List, Set
-from pydantic import BaseModel, Field, field_validator
+from typing import FrozenSet, Optional, List, Set
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,6 +18,10 @@ VALID_SKILL_GATE_MODES = ("off", "shadow", "warn", "enforce", "strict")
 
 
 class MCPServerConfig(BaseModel):
+    # Defer pydantic core-schema compilation from import time to first
+    # instantiation — the model is only ever built once, in load_config().
+    model_config = ConfigDict(defer_build=True)
+
     base_url: str = Field(default_factory=lambda: os.getenv("CEKURA_BASE_URL", "https://api.cekura.ai"))
     openapi_spec_path: str = Field(default_factory=lambda: os.getenv("CEKURA_OPENAPI_SPEC_PATH", "../openapi.json"))
     max_tools: Optional[int] = Field(default_factory=lambda: _parse_int_env("CEKURA_MAX_TOOLS"))
@@ -26,12 +30,16 @@ class MCPServerConfig(BaseModel):
     max_examples_per_tool: int = Field(default_factory=lambda: _parse_int_env("CEKURA_MAX_EXAMPLES_PER_TOOL") or 2)
     skill_gate_mode: str = Field(default_factory=lambda: _parse_gate_mode_env())
 
-    def resolve_blocked_tools(self) -> Set[str]:
-        """Final set of tool names to suppress at registration."""
+    def resolve_blocked_tools(self) -> FrozenSet[str]:
+        """Final set of tool names to suppress at registration.
+
+        Frozen: callers only do membership tests, and an immutable result
+        can't drift from the config it was derived from.
+        """
         blocked = set(self.blocked_tools)
         if not self.expose_project_destroy:
             blocked.add("projects_destroy")
-        return blocked
+        return frozenset(blocked)
 
     @field_validator("base_url")
     @classmethod
@@ -1,8 +1,10 @@
 import asyncio
+import functools
 import hashlib
 import json
 import logging
 import os
+import random
 import re
 import sys
 import time
@@ -12,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 import jwt
+import orjson
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.types import ToolAnnotations
@@ -25,19 +28,23 @@ if os.getenv("AWS_SECRET_NAME"):
     os.environ.update({key: str(value) for key, value in _config.items()})
 
 import skill_gate
-from config import load_config
-from http_client import build_mcp_headers, create_client
+from http_client import (
+    aclose_pooled_clients,
+    build_mcp_headers,
+    compute_json_fields,
+    create_client,
+)
 from openapi_parser import load_openapi_spec
 from tool_generator import (
     apply_overlay_to_description,
     apply_overlay_to_schema,
     build_input_schema,
     compute_annotations,
+    filter_operations,
     generate_tool_description,
     generate_tool_name,
     generate_tool_title,
     maybe_append_org_project_hint,
-    should_include_operation,
 )
 
 logging.basicConfig(
@@ -48,10 +55,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# One compiled alternation instead of three substring scans per access-log
+# record. '/mcp/health' also covers '/mcp/healthz'.
+_HEALTH_LOG_RE = re.compile(r'/mcp/health|/favicon\.ico')
+
+
 class HealthCheckFilter(logging.Filter):
     def filter(self, record):
-        message = record.getMessage()
-        return not any(path in message for path in ['/mcp/health', '/mcp/healthz', '/favicon.ico'])
+        # Uvicorn access records carry (client_addr, method, path, http_version,
+        # status) as raw args — test the path directly and skip formatting the
+        # message for the common keep case. Other records fall back to one
+        # regex scan over the formatted message.
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5 and isinstance(args[2], str):
+            path = args[2]
+            return not (path.startswith('/mcp/health') or path.startswith('/favicon.ico'))
+        return _HEALTH_LOG_RE.search(record.getMessage()) is None
 
 request_api_key: ContextVar[str] = ContextVar('request_api_key', default=None)
 request_bearer_token: ContextVar[str] = ContextVar('request_bearer_token', default=None)
@@ -135,41 +154,102 @@ MINTLIFY_MAX_RETRIES = 2
 MINTLIFY_TOOL_NAME = "search_cekura"  # Fallback, will be dynamically fetched
 
 
-async def fetch_mintlify_tool_name():
-    """Fetch the search tool name from Mintlify's MCP server dynamically. """
-    global MINTLIFY_TOOL_NAME
+# One shared client for all traffic to the Mintlify MCP endpoint (tool-name
+# discovery at startup, every proxied search after that) so searches reuse a
+# warm connection instead of paying a TLS handshake per query. Bound to the
+# event loop it was created on: discovery runs under asyncio.run() on a
+# temporary loop before uvicorn starts its own, and a client carried across
+# would hand dead-loop keepalive connections (and a dead-loop lock) to the
+# serving loop — first search inside the keepalive window would fail with
+# "Event loop is closed".
+_mintlify_client: Optional[httpx.AsyncClient] = None
+_mintlify_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_mintlify_client_lock: Optional[asyncio.Lock] = None
+
+
+async def _get_mintlify_client() -> httpx.AsyncClient:
+    global _mintlify_client, _mintlify_client_loop, _mintlify_client_lock
+    loop = asyncio.get_running_loop()
+    if loop is not _mintlify_client_loop:
+        # Client and lock belong to a previous (now defunct) loop and cannot
+        # be awaited from this one; drop them and let GC reclaim the sockets.
+        _mintlify_client = None
+        _mintlify_client_lock = asyncio.Lock()
+        _mintlify_client_loop = loop
+    if _mintlify_client is None or _mintlify_client.is_closed:
+        async with _mintlify_client_lock:
+            if _mintlify_client is None or _mintlify_client.is_closed:
+                _mintlify_client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(MINTLIFY_SEARCH_TIMEOUT, connect=5.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10,
+                        max_connections=20,
+                        keepalive_expiry=30,
+                    ),
+                    # Searches hit the URL pinned at discovery time; a 3xx on
+                    # the hot path is a config problem and should surface as an
+                    # error, not a silent extra round trip per query.
+                    follow_redirects=False,
+                )
+    return _mintlify_client
 
-    try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(5.0, connect=2.0)) as client:
-            response = await client.post(
-                MINTLIFY_MCP_URL,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/list"
-                }
-            )
-            response.raise_for_status()
 
-            # Parse SSE response
-            for line in response.text.split('\n'):
-                if line.startswith('data: '):
-                    data = json.loads(line[6:])
+async def aclose_mintlify_client() -> None:
+    """Close the shared Mintlify client. Wired to app shutdown."""
+    global _mintlify_client
+    client, _mintlify_client = _mintlify_client, None
+    if client is None or client.is_closed:
+        return
+    if _mintlify_client_loop is asyncio.get_running_loop():
+        await client.aclose()
+    # else: created on a loop that no longer runs; its transport cannot be
+    # closed from here — dropping the reference is all that is left to do.
 
-                    if 'result' in data and 'tools' in data['result']:
-                        # Find search tool (contains "search" and "cekura")
-                        for tool in data['result']['tools']:
-                            name = tool.get('name', '').lower()
-                            if 'search' in name and 'cekura' in name:
-                                MINTLIFY_TOOL_NAME = tool['name']
-                                logger.info(f"Discovered Mintlify tool name: {MINTLIFY_TOOL_NAME}")
-                                return
 
-            logger.warning(f"Mintlify search tool not found in response, using fallback: {MINTLIFY_TOOL_NAME}")
+async def fetch_mintlify_tool_name():
+    """Fetch the search tool name from Mintlify's MCP server dynamically. """
+    global MINTLIFY_TOOL_NAME, MINTLIFY_MCP_URL
+
+    try:
+        client = await _get_mintlify_client()
+        response = await client.post(
+            MINTLIFY_MCP_URL,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+            content=orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/list"
+            }),
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+
+        # Pin subsequent searches to the final URL so they never re-pay a
+        # redirect hop (the shared client doesn't follow redirects).
+        final_url = str(response.url)
+        if final_url != MINTLIFY_MCP_URL:
+            logger.info(f"Mintlify MCP URL redirected; pinning {final_url}")
+            MINTLIFY_MCP_URL = final_url
+
+        # Parse SSE response
+        for line in response.text.split('\n'):
+            if line.startswith('data: '):
+                data = orjson.loads(line[6:])
+
+                if 'result' in data and 'tools' in data['result']:
+                    # Find search tool (contains "search" and "cekura")
+                    for tool in data['result']['tools']:
+                        name = tool.get('name', '').lower()
+                        if 'search' in name and 'cekura' in name:
+                            MINTLIFY_TOOL_NAME = tool['name']
+                            logger.info(f"Discovered Mintlify tool name: {MINTLIFY_TOOL_NAME}")
+                            return
+
+        logger.warning(f"Mintlify search tool not found in response, using fallback: {MINTLIFY_TOOL_NAME}")
 
     except Exception as e:
         logger.warning(f"Failed to fetch Mintlify tool name (using fallback '{MINTLIFY_TOOL_NAME}'): {e}")
@@ -179,26 +259,38 @@ async def initialize_server():
     global server_config, openapi_parser, operations_registry
 
     try:
-        # Fetch Mintlify's actual tool name
-        await fetch_mintlify_tool_name()
+        # Kick off Mintlify tool-name discovery (network-bound) concurrently
+        # with the local spec load and registration; awaited just before the
+        # search tool is registered under the discovered name.
+        mintlify_task = asyncio.create_task(fetch_mintlify_tool_name())
+
+        # Imported here, not at module top: config pulls in pydantic and
+        # dotenv, which aren't needed just to import this module.
+        from config import load_config
 
         server_config = load_config()
         logger.info(f"Loaded config: Base URL={server_config.base_url}")
 
-        openapi_parser = load_openapi_spec(server_config.openapi_spec_path)
+        # Parse the multi-megabyte spec off the event loop so the Mintlify
+        # discovery task above can make network progress while we read disk.
+        openapi_parser = await asyncio.to_thread(
+            load_openapi_spec, server_config.openapi_spec_path
+        )
         logger.info(f"Loaded OpenAPI spec from {server_config.openapi_spec_path}")
 
         operations = openapi_parser.extract_operations()
         logger.info(f"Found {len(operations)} operations in OpenAPI spec")
 
+        # Filter once up front instead of per-iteration inside the
+        # registration loop.
+        operations = filter_operations(operations)
+        logger.info(f"{len(operations)} operations exposed via x-mcp-expose")
+
         blocked_tools = server_config.resolve_blocked_tools()
 
         tools_registered = 0
         blocked_hits = []
         for operation in operations:
-            if not should_include_operation(operation):
-                continue
-
             if server_config.max_tools and tools_registered >= server_config.max_tools:
                 logger.warning(f"Reached max_tools limit ({server_config.max_tools}), stopping registration")
                 break
@@ -210,18 +302,7 @@ async def initialize_server():
                     blocked_hits.append(tool_name)
                     continue
 
-                tool_description = generate_tool_description(operation)
-                input_schema = build_input_schema(operation, openapi_parser)
-
-                tool_description = maybe_append_org_project_hint(tool_name, input_schema, tool_description)
-                tool_description = apply_overlay_to_description(tool_name, tool_description)
-                input_schema = apply_overlay_to_schema(tool_name, input_schema)
-                input_schema = skill_gate.maybe_inject_skill_ack(
-                    tool_name, input_schema, server_config.skill_gate_mode
-                )
-
-                annotations = compute_annotations(operation)
-                register_tool(tool_name, tool_description, input_schema, operation, annotations=annotations)
+                register_tool(tool_name, operation)
                 tools_registered += 1
             except Exception as e:
                 logger.error(f"Error registering tool for {operation.path}: {e}", exc_info=True)
@@ -254,7 +335,9 @@ async def initialize_server():
         except Exception as e:
             logger.warning(f"Overlay drift check skipped: {e}")
 
-        # Register Mintlify documentation search tool
+        # Register Mintlify documentation search tool (discovery ran in the
+        # background while the spec loaded; it handles its own failures).
+        await mintlify_task
         register_mintlify_search_tool()
         logger.info("Registered Mintlify documentation search tool")
 
@@ -315,6 +398,55 @@ def register_mintlify_search_tool():
     }
 
 
+def _parse_sse_data_line(line: bytes) -> Optional[Any]:
+    """Return `result.content` from one SSE `data:` line, else None."""
+    line = line.rstrip(b'\r')
+    if not line.startswith(b'data: '):
+        return None
+    # Keepalives, progress notifications and other interim events can't carry
+    # the payload we want; a byte scan is far cheaper than parsing them.
+    if b'"result"' not in line:
+        return None
+    try:
+        data = orjson.loads(line[6:])
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Failed to parse SSE data: {e}")
+        return None
+    result = data.get('result')
+    if isinstance(result, dict) and result.get('content'):
+        return result['content']
+    return None
+
+
+async def _read_sse_result(response: httpx.Response) -> Optional[Any]:
+    """Incrementally parse an SSE byte stream for the first result content.
+
+    Lines are carved off a rolling buffer as chunks arrive, so parsing starts
+    before the body finishes and the whole response is never materialized as
+    one string; returning early abandons the rest of the stream.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        while True:
+            nl = buffer.find(b'\n')
+            if nl < 0:
+                break
+            line = bytes(buffer[:nl])
+            del buffer[:nl + 1]
+            content = _parse_sse_data_line(line)
+            if content is not None:
+                return content
+    if buffer:
+        return _parse_sse_data_line(bytes(buffer))
+    return None
+
+
+def _retry_backoff(attempt: int) -> float:
+    """Capped exponential backoff with jitter to avoid synchronized retries."""
+    return min(0.25 * 2 ** attempt, 2.0) * random.uniform(0.8, 1.2)
+
+
 async def call_mintlify_search(query: str) -> List[Dict[str, str]]:
     """Proxy search requests to Mintlify's MCP server with retry logic."""
     if not query or not query.strip():
@@ -322,47 +454,35 @@ async def call_mintlify_search(query: str) -> List[Dict[str, str]]:
 
     for attempt in range(MINTLIFY_MAX_RETRIES):
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(MINTLIFY_SEARCH_TIMEOUT, connect=5.0),
-                follow_redirects=True
-            ) as client:
-                response = await client.post(
-                    MINTLIFY_MCP_URL,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json, text/event-stream"
-                    },
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "tools/call",
-                        "params": {
-                            "name": MINTLIFY_TOOL_NAME,
-                            "arguments": {"query": query.strip()}
-                        }
+            client = await _get_mintlify_client()
+            async with client.stream(
+                "POST",
+                MINTLIFY_MCP_URL,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json, text/event-stream"
+                },
+                content=orjson.dumps({
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "tools/call",
+                    "params": {
+                        "name": MINTLIFY_TOOL_NAME,
+                        "arguments": {"query": query.strip()}
                     }
-                )
-
+                })
+            ) as response:
                 response.raise_for_status()
+                content = await _read_sse_result(response)
 
-                for line in response.text.split('\n'):
-                    if line.startswith('data: '):
-                        try:
-                            data = json.loads(line[6:])
-                            if 'result' in data and 'content' in data['result']:
-                                content = data['result']['content']
-                                if content:
-                                    return content
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse SSE data: {e}")
-                            continue
-
-                return [{"type": "text", "text": "No results found for your query."}]
+            if content:
+                return content
+            return [{"type": "text", "text": "No results found for your query."}]
 
         except httpx.TimeoutException:
             logger.warning(f"Timeout calling Mintlify search (attempt {attempt + 1}/{MINTLIFY_MAX_RETRIES})")
             if attempt < MINTLIFY_MAX_RETRIES - 1:
-                await asyncio.sleep(0.5 * (attempt + 1))
+                await asyncio.sleep(_retry_backoff(attempt))
                 continue
             return [{"type": "text", "text": "Search request timed out. Please try again."}]
 
@@ -373,7 +493,7 @@ async def call_mintlify_search(query: str) -> List[Dict[str, str]]:
         except httpx.RequestError as e:
             logger.error(f"Network error calling Mintlify: {e}")
             if attempt < MINTLIFY_MAX_RETRIES - 1:
-                await asyncio.sleep(0.5 * (attempt + 1))
+                await asyncio.sleep(_retry_backoff(attempt))
                 continue
             return [{"type": "text", "text": "Unable to reach documentation search. Please check your connection."}]
 
@@ -384,20 +504,48 @@ async def call_mintlify_search(query: str) -> List[Dict[str, str]]:
     return [{"type": "text", "text": "Search failed after multiple attempts. Please try again later."}]
 
 
-def register_tool(
-    name: str,
-    description: str,
-    input_schema: Dict[str, Any],
-    operation,
-    annotations: ToolAnnotations = None,
-):
-    operations_registry[name] = {
-        'operation': operation,
-        'schema': input_schema,
-        'description': description,
-        'annotations': annotations,
-        'title': generate_tool_title(name, operation),
-    }
+def register_tool(name: str, operation):
+    """Index an operation under its tool name. Only the name is computed eagerly
+    (it's needed for dispatch and blocked-tool checks); the description, input
+    schema, overlays, and annotations are built lazily by `_ensure_tool_built`
+    on the first `list_tools`/`call_tool` hit and cached in the registry entry.
+    Keeps cold start O(operations) cheap instead of O(operations × schema size).
+    """
+    operations_registry[name] = {'operation': operation}
+
+
+def _ensure_tool_built(name: str) -> Dict[str, Any]:
+    """Build (once) and return the full registry entry for a tool.
+
+    The first access pays the schema/description/overlay cost; subsequent
+    accesses are a dict lookup. Proxy tools register fully-built entries and
+    pass straight through.
+    """
+    data = operations_registry[name]
+    if 'schema' in data:
+        return data
+
+    operation = data['operation']
+    tool_description = generate_tool_description(operation)
+    input_schema = build_input_schema(operation, openapi_parser)
+
+    tool_description = maybe_append_org_project_hint(name, input_schema, tool_description)
+    tool_description = apply_overlay_to_description(name, tool_description)
+    input_schema = apply_overlay_to_schema(name, input_schema)
+    input_schema = skill_gate.maybe_inject_skill_ack(
+        name, input_schema, server_config.skill_gate_mode if server_config else "off"
+    )
+
+    data['schema'] = input_schema
+    data['description'] = tool_description
+    data['annotations'] = compute_annotations(operation)
+    data['title'] = generate_tool_title(name, operation)
+    data['dispatch'] = _compile_dispatch(operation)
+    data['json_fields'] = compute_json_fields((input_schema.get('properties') or {}).keys())
+    return data
+
+
+_available_tools_text: Optional[str] = None
 
 
 @mcp.tool(
@@ -407,8 +555,15 @@ def register_tool(
     annotations=ToolAnnotations(readOnlyHint=True),
 )
 async def list_available_tools() -> str:
-    tools = sorted(operations_registry.keys())
-    return f"Available tools ({len(tools)}):\n" + "\n".join(f"- {tool}" for tool in tools)
+    # The registry is fixed after initialization, so the listing is formatted
+    # once and reused.
+    global _available_tools_text
+    if _available_tools_text is None:
+        tools = sorted(operations_registry.keys())
+        _available_tools_text = (
+            f"Available tools ({len(tools)}):\n" + "\n".join(f"- {tool}" for tool in tools)
+        )
+    return _available_tools_text
 
 
 @mcp.tool(
@@ -1018,10 +1173,64 @@ def _resolve_telemetry() -> Dict[str, Optional[str]]:
     }
 
 
+def _dumps_result(result: Any) -> str:
+    """Serialize an upstream response payload for the tool result text.
+
+    orjson handles the common dict/list payloads; anything it can't encode
+    (exotic default=str cases) falls back to the stdlib encoder with the same
+    non-ASCII-preserving semantics.
+    """
+    try:
+        return orjson.dumps(result, default=str).decode()
+    except TypeError:
+        return json.dumps(result, default=str, ensure_ascii=False)
+
+
 _PATH_PARAM_RE = re.compile(r'\{(\w+)\}')
 
 
-def _dispatch_args(op, arguments: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Any]:
+@functools.lru_cache(maxsize=512)
+def _parse_path(path: str) -> frozenset:
+    """Param names in an OpenAPI path template, memoized per distinct path.
+
+    The set of `{name}` placeholders is fixed per operation, so repeated calls
+    to the same tool become a cache hit instead of a regex walk.
+    """
+    return frozenset(_PATH_PARAM_RE.findall(path))
+
+
+def _compile_dispatch(op) -> Tuple[frozenset, frozenset, bool, bool]:
+    """Precompute the per-operation facts `_dispatch_args` needs.
+
+    The operation is immutable after registration, so the placeholder set,
+    query-param set, and body shape are computed once (cached in the registry
+    entry by `_ensure_tool_built`) rather than re-derived on every call.
+    """
+    path_param_names = _parse_path(op.path)
+    query_param_names = frozenset(
+        p["name"] for p in (op.parameters or [])
+        if p.get("in") == "query" and "name" in p
+    )
+    has_body = bool(op.request_body)
+    array_body = False
+    if has_body:
+        schema = op.request_body.get("content", {}).get("application/json", {}).get("schema", {})
+        array_body = schema.get("type") == "array"
+    return path_param_names, query_param_names, has_body, array_body
+
+
+class _UnresolvedPathParams(dict):
+    """format_map table that leaves unsupplied `{name}` placeholders literal."""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def _dispatch_args(
+    op,
+    arguments: Dict[str, Any],
+    dispatch: Optional[Tuple[frozenset, frozenset, bool, bool]] = None,
+) -> Tuple[str, Dict[str, Any], Any]:
     """Classify tool args into (resolved_path, query_params, body_payload).
 
     Classification rules:
@@ -1032,14 +1241,11 @@ def _dispatch_args(op, arguments: Dict[str, Any]) -> Tuple[str, Dict[str, Any],
     For top-level array bodies (bulk endpoints), the `items` arg is unwrapped so
     the body is sent as a bare JSON array.
     """
-    path_param_names = set(_PATH_PARAM_RE.findall(op.path))
-    query_param_names = {
-        p["name"] for p in (op.parameters or [])
-        if p.get("in") == "query" and "name" in p
-    }
-    has_body = bool(op.request_body)
+    if dispatch is None:
+        dispatch = _compile_dispatch(op)
+    path_param_names, query_param_names, has_body, array_body = dispatch
 
-    resolved_path = op.path
+    path_args: Dict[str, str] = {}
     query_args: Dict[str, Any] = {}
     body_args: Dict[str, Any] = {}
 
@@ -1047,7 +1253,7 @@ def _dispatch_args(op, arguments: Dict[str, Any]) -> Tuple[str, Dict[str, Any],
         if value is None:
             continue
         if key in path_param_names:
-            resolved_path = resolved_path.replace(f"{{{key}}}", _quote(str(value), safe=""))
+            path_args[key] = _quote(str(value), safe="")
         elif key in query_param_names:
             query_args[key] = value
         elif has_body:
@@ -1055,10 +1261,12 @@ def _dispatch_args(op, arguments: Dict[str, Any]) -> Tuple[str, Dict[str, Any],
         else:
             query_args[key] = value
 
-    if has_body:
-        schema = op.request_body.get("content", {}).get("application/json", {}).get("schema", {})
-        if schema.get("type") == "array" and "items" in body_args:
-            return resolved_path, query_args, body_args["items"]
+    # One pass over the template instead of a str.replace per path param;
+    # placeholders the caller didn't supply stay literal, as before.
+    resolved_path = op.path.format_map(_UnresolvedPathParams(path_args)) if path_args else op.path
+
+    if array_body and "items" in body_args:
+        return resolved_path, query_args, body_args["items"]
 
     return resolved_path, query_args, (body_args if has_body else None)
 
@@ -1069,21 +1277,30 @@ def setup_dynamic_tool_handlers():
     original_list_tools = mcp.list_tools
     original_call_tool = mcp.call_tool
 
+    # The registry is static after initialize_server, so the MCPTool models
+    # are built once on the first tools/list and reused; polling clients get a
+    # list concatenation instead of N pydantic constructions per poll.
+    dynamic_tools_cache: List[Any] = []
+
     async def list_tools_with_dynamic():
         regular_tools = await original_list_tools()
 
-        dynamic_tools = [
-            MCPTool(
-                name=name,
-                title=data['title'],
-                description=data['description'],
-                inputSchema=data['schema'],
-                annotations=data.get('annotations'),
-            )
-            for name, data in operations_registry.items()
-        ]
+        if not dynamic_tools_cache:
+            for name in operations_registry:
+                try:
+                    data = _ensure_tool_built(name)
+                except Exception as e:
+                    logger.error(f"Error building tool schema for {name}: {e}", exc_info=True)
+                    continue
+                dynamic_tools_cache.append(MCPTool(
+                    name=name,
+                    title=data['title'],
+                    description=data['description'],
+                    inputSchema=data['schema'],
+                    annotations=data.get('annotations'),
+                ))
 
-        return regular_tools + dynamic_tools
+        return regular_tools + dynamic_tools_cache
 
     async def call_tool_with_dynamic(name: str, arguments: dict):
         if name not in operations_registry:
@@ -1110,7 +1327,7 @@ def setup_dynamic_tool_handlers():
             return [{"type": "text", "text": f"{gate_deny}{call_id_suffix}"}]
 
         try:
-            tool_data = operations_registry[name]
+            tool_data = _ensure_tool_built(name)
 
             if tool_data.get('is_proxy'):
                 query = (arguments or {}).get('query', '')
@@ -1142,19 +1359,21 @@ def setup_dynamic_tool_handlers():
                 k: v.get('type') for k, v in schema_properties.items() if isinstance(v, dict)
             }
 
-            resolved_path, query_args, body_payload = _dispatch_args(op, arguments or {})
-            try:
-                result = await user_api_client.execute_request(
-                    method=op.method,
-                    path=resolved_path,
-                    query_params=query_args,
-                    body=body_payload,
-                    property_types=property_types,
-                )
-            finally:
-                await user_api_client.close()
+            resolved_path, query_args, body_payload = _dispatch_args(
+                op, arguments or {}, tool_data.get('dispatch')
+            )
+            # The client's underlying connection is pooled per credential — no
+            # per-call close; connections are reused across tool invocations.
+            result = await user_api_client.execute_request(
+                method=op.method,
+                path=resolved_path,
+                query_params=query_args,
+                body=body_payload,
+                property_types=property_types,
+                json_fields=tool_data.get('json_fields'),
+            )
 
-            text = json.dumps(result, default=str, ensure_ascii=False)
+            text = _dumps_result(result)
             nudge = gate_nudge or ""
             return [{"type": "text", "text": f"{text}{nudge}{call_id_suffix}"}]
 
@@ -1177,6 +1396,15 @@ def main():
     from starlette.responses import JSONResponse, Response
     from starlette.routing import Route
 
+    # uvloop when available (Linux/macOS deploys); the default loop is a
+    # functional fallback everywhere else.
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(description="Cekura OpenAPI MCP Server")
     parser.add_argument("--port", type=int, default=8001, help="Port to run the HTTP server on (default: 8001)")
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
@@ -1287,12 +1515,17 @@ def main():
                     except (ValueError, LookupError):
                         pass
 
+    # The registry is fixed once initialize_server has run, so the health
+    # payload is constant per process — serialize it once and hand load
+    # balancer probes the same bytes instead of re-encoding per hit.
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "service": "cekura-mcp-server",
+        "tools_registered": len(operations_registry)
+    })
+
     async def health_check(request):
-        return JSONResponse({
-            "status": "healthy",
-            "service": "cekura-mcp-server",
-            "tools_registered": len(operations_registry)
-        })
+        return Response(health_body, media_type="application/json")
 
     def _has_api_key(request) -> bool:
         return bool(
@@ -1333,6 +1566,8 @@ def main():
     app.router.routes.insert(4, Route("/mcp/health", health_check))
     app.router.routes.insert(5, Route("/mcp/healthz", health_check))
 
+    app.add_event_handler("shutdown", aclose_pooled_clients)
+    app.add_event_handler("shutdown", aclose_mintlify_client)
     app.add_middleware(CredentialMiddleware)
     logger.info("Credential middleware added (API key + Bearer token support)")
     logger.info(f"OAuth discovery: {MCP_SERVER_URL}/.well-known/oauth-protected-resource → {MCP_ISSUER_URL}")
@@ -1,9 +1,19 @@
-import json
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+import orjson
 
-@dataclass
+
+# slots=True: one Operation per spec endpoint — dropping the per-instance
+# __dict__ shrinks the registry's footprint and speeds attribute access.
+# frozen=True: operations are parse-time facts; immutability guarantees the
+# memoized name/description caches can never go stale.
+@dataclass(slots=True, frozen=True)
 class Operation:
     path: str
     method: str
@@ -18,8 +28,30 @@ class Operation:
     extensions: Dict[str, Any] = None
 
     def __post_init__(self):
+        # object.__setattr__ because the dataclass is frozen; this is the
+        # one sanctioned mutation point, during construction.
         if self.extensions is None:
-            self.extensions = {}
+            object.__setattr__(self, 'extensions', {})
+        # Paths are reused as dict keys and format templates downstream;
+        # interning gives them the pointer-equality hash fast path.
+        object.__setattr__(self, 'path', sys.intern(self.path))
+        # Normalize once so downstream consumers (annotations, naming,
+        # dispatch) never re-uppercase; one shared str per HTTP verb.
+        object.__setattr__(self, 'method', sys.intern(self.method.upper()))
+
+
+_METHODS = ("get", "post", "put", "patch", "delete")
+
+# OpenAPI → JSON-schema type names accepted by MCP clients; anything else
+# (including unknown custom types) maps to string.
+_TYPE_MAPPING = {
+    "integer": "integer",
+    "number": "number",
+    "string": "string",
+    "boolean": "boolean",
+    "array": "array",
+    "object": "object",
+}
 
 
 class OpenAPIParser:
@@ -27,36 +59,116 @@ class OpenAPIParser:
         self.spec_path = spec_path
         self.spec: Dict[str, Any] = {}
         self.schema_cache: Dict[str, Any] = {}
+        # $ref → built properties. Specs repeat the same component schemas
+        # across many operations; extract each once.
+        self.extracted_props_cache: Dict[str, Dict[str, Any]] = {}
+        # Flattened Operation list, built once per loaded spec.
+        self._operations: Optional[List[Operation]] = None
+
+    # Bump when the snapshot payload shape changes.
+    _SNAPSHOT_VERSION = 1
+
+    def _snapshot_dir(self) -> str:
+        """User-owned 0700 cache directory for spec snapshots.
+
+        Never the shared temp dir: snapshots are unpickled, and in a
+        world-writable location another local user could pre-create the
+        file with arbitrary pickle bytes before our first write.
+        """
+        cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_root, "cekura-mcp")
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        return cache_dir
+
+    def _snapshot_path(self) -> str:
+        """Per-spec snapshot file inside the user cache dir."""
+        digest = hashlib.sha256(os.path.abspath(self.spec_path).encode()).hexdigest()[:16]
+        return os.path.join(self._snapshot_dir(), f"openapi_{digest}.pickle")
 
     def load_spec(self) -> Dict[str, Any]:
-        with open(self.spec_path, 'r') as f:
-            self.spec = json.load(f)
+        # The spec is multi-megabyte; restarts reuse a pickled snapshot keyed
+        # by the spec file's mtime+size, falling back to a fresh orjson parse
+        # (plain dicts — the $ref-resolving walkers need them) on any miss.
+        st = os.stat(self.spec_path)
+        self._operations = None
+        try:
+            snapshot = self._snapshot_path()
+        except OSError:
+            snapshot = None
+        if snapshot is not None:
+            try:
+                with open(snapshot, 'rb') as f:
+                    # Refuse foreign bytes before they reach pickle: only a
+                    # file we wrote ourselves is trusted.
+                    if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                        raise ValueError("snapshot not owned by current user")
+                    version, mtime_ns, size, spec = pickle.load(f)
+                if (
+                    version == self._SNAPSHOT_VERSION
+                    and mtime_ns == st.st_mtime_ns
+                    and size == st.st_size
+                ):
+                    self.spec = spec
+                    return self.spec
+            except Exception:
+                pass
+
+        with open(self.spec_path, 'rb') as f:
+            self.spec = orjson.loads(f.read())
+
+        # Best-effort snapshot write; atomic via os.replace so a concurrent
+        # reader never sees a partial file.
+        if snapshot is not None:
+            try:
+                payload = pickle.dumps(
+                    (self._SNAPSHOT_VERSION, st.st_mtime_ns, st.st_size, self.spec),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(snapshot), prefix='openapi_'
+                )
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, snapshot)
+            except Exception:
+                pass
+
         return self.spec
 
     def extract_operations(self) -> List[Operation]:
+        # The spec is immutable once loaded; walk it once and hand the same
+        # list to every caller (server registration, overlay validation).
+        if self._operations is not None:
+            return self._operations
+
         operations = []
         paths = self.spec.get("paths", {})
 
         for path, path_item in paths.items():
-            for method in ["get", "post", "put", "patch", "delete"]:
-                if method in path_item:
-                    operation_data = path_item[method]
-                    extensions = {k: v for k, v in operation_data.items() if k.startswith("x-")}
-                    operation = Operation(
-                        path=path,
-                        method=method.upper(),
-                        operation_id=operation_data.get("operationId"),
-                        summary=operation_data.get("summary"),
-                        description=operation_data.get("description"),
-                        parameters=operation_data.get("parameters", []),
-                        request_body=operation_data.get("requestBody"),
-                        responses=operation_data.get("responses", {}),
-                        tags=operation_data.get("tags", []),
-                        deprecated=operation_data.get("deprecated", False),
-                        extensions=extensions,
-                    )
-                    operations.append(operation)
-
+            for method in _METHODS:
+                operation_data = path_item.get(method)
+                if operation_data is None:
+                    continue
+                extensions = {k: v for k, v in operation_data.items() if k.startswith("x-")}
+                _get = operation_data.get
+                operations.append(Operation(
+                    path=path,
+                    # Upper-cased and interned in __post_init__.
+                    method=method,
+                    operation_id=_get("operationId"),
+                    summary=_get("summary"),
+                    description=_get("description"),
+                    parameters=_get("parameters", []),
+                    request_body=_get("requestBody"),
+                    responses=_get("responses", {}),
+                    tags=_get("tags", []),
+                    deprecated=_get("deprecated", False),
+                    extensions=extensions,
+                ))
+
+        self._operations = operations
         return operations
 
     def resolve_schema_ref(self, ref: str) -> Dict[str, Any]:
@@ -89,6 +201,10 @@ class OpenAPIParser:
 
         for param in operation.parameters:
             param_name = param.get("name")
+            if isinstance(param_name, str):
+                # Names like `organization` recur across most operations;
+                # interning dedupes them and speeds the dict probes below.
+                param_name = sys.intern(param_name)
             param_schema = param.get("schema", {})
             param_required = param.get("required", False)
             param_description = param.get("description", "")
@@ -180,11 +296,19 @@ class OpenAPIParser:
         return result
 
     def _extract_schema_properties(self, schema: Dict[str, Any]) -> Dict[str, Any]:
-        if "$ref" in schema:
-            schema = self.resolve_schema_ref(schema["$ref"])
+        ref = schema.get("$ref")
+        if ref is not None:
+            cached = self.extracted_props_cache.get(ref)
+            if cached is not None:
+                # Per-property shallow copies: the overlay layer mutates the
+                # top-level entries (type, additionalProperties), and those
+                # edits must not leak between tools sharing a component.
+                return {k: dict(v) for k, v in cached.items()}
+            schema = self.resolve_schema_ref(ref)
 
         properties = {}
         for prop_name, prop_schema in schema.get("properties", {}).items():
+            prop_name = sys.intern(prop_name)
             prop_description = prop_schema.get("description", "")
 
             # Resolve oneOf/anyOf to a concrete type. When one option is {} (any-type),
@@ -253,26 +377,15 @@ class OpenAPIParser:
                         else "string"
                     }
 
+        if ref is not None:
+            self.extracted_props_cache[ref] = properties
+            return {k: dict(v) for k, v in properties.items()}
         return properties
 
     def _convert_openapi_type(self, openapi_type) -> str:
         if isinstance(openapi_type, list):
-            for t in openapi_type:
-                if t != "null":
-                    openapi_type = t
-                    break
-            else:
-                openapi_type = "string"
-
-        type_mapping = {
-            "integer": "integer",
-            "number": "number",
-            "string": "string",
-            "boolean": "boolean",
-            "array": "array",
-            "object": "object"
-        }
-        return type_mapping.get(openapi_type, "string")
+            openapi_type = next((t for t in openapi_type if t != "null"), "string")
+        return _TYPE_MAPPING.get(openapi_type, "string")
 
 
 def load_openapi_spec(file_path: str) -> OpenAPIParser:
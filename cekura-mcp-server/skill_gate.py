@@ -33,6 +33,7 @@ import logging
 import os
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -162,8 +163,8 @@ def get_manifest():
 def _load_baked():
     global _manifest, _manifest_source
     try:
-        with open(_BAKED_MANIFEST_PATH) as fh:
-            _manifest = _parse_manifest(json.load(fh))
+        with open(_BAKED_MANIFEST_PATH, 'rb') as fh:
+            _manifest = _parse_manifest(orjson.loads(fh.read()))
             _manifest_source = "baked"
     except Exception:
         _manifest = {}
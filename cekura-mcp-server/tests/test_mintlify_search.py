@@ -0,0 +1,64 @@
+"""Tests for the Mintlify search retry loop: backoff must run on
+asyncio.sleep (a blocking time.sleep would stall the event loop and
+serialize every concurrent tool call) and the final attempt must not
+sleep before returning the error."""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+import openapi_mcp_server
+from openapi_mcp_server import call_mintlify_search
+
+
+class TimeoutStreamClient:
+    """Fake shared client whose stream always times out."""
+
+    @asynccontextmanager
+    async def stream(self, *args, **kwargs):
+        raise httpx.TimeoutException("connect timed out")
+        yield  # pragma: no cover
+
+
+@pytest.fixture
+def timeout_client(monkeypatch):
+    async def fake_get_client():
+        return TimeoutStreamClient()
+
+    monkeypatch.setattr(openapi_mcp_server, "_get_mintlify_client", fake_get_client)
+
+
+@pytest.fixture
+def no_blocking_sleep(monkeypatch):
+    def forbidden_sleep(*args, **kwargs):
+        raise AssertionError("time.sleep called inside an async handler")
+
+    monkeypatch.setattr(time, "sleep", forbidden_sleep)
+
+
+async def test_retry_sleeps_on_event_loop(timeout_client, no_blocking_sleep, monkeypatch):
+    recorded = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        recorded.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+
+    result = await call_mintlify_search("how do I create a scenario")
+
+    assert result == [{"type": "text", "text": "Search request timed out. Please try again."}]
+    # One backoff between the two attempts, none after the final failure.
+    assert len(recorded) == openapi_mcp_server.MINTLIFY_MAX_RETRIES - 1
+    assert all(delay > 0 for delay in recorded)
+
+
+async def test_backoff_is_capped_exponential():
+    delays = [openapi_mcp_server._retry_backoff(attempt) for attempt in range(8)]
+    # Jitter stays within +/-20% of the capped exponential schedule.
+    for attempt, delay in enumerate(delays):
+        base = min(0.25 * 2 ** attempt, 2.0)
+        assert base * 0.8 <= delay <= base * 1.2
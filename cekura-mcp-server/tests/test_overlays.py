@@ -79,15 +79,14 @@ def test_example_request_fields_exist(findings):
 # Generate/improve preference suffixes — keep agents off raw create/patch
 # ---------------------------------------------------------------------------
 
-import json as _json
+import orjson as _orjson
 from pathlib import Path as _Path
 
 _OVERLAYS_FILE = _Path(__file__).parent.parent / "mcp_tools.json"
 
 
 def _load_overlays():
-    with open(_OVERLAYS_FILE, "r") as fh:
-        return _json.load(fh)
+    return _orjson.loads(_OVERLAYS_FILE.read_bytes())
 
 
 # Tools where reaching for a raw create/patch is almost always wrong when an
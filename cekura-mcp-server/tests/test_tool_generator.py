@@ -142,11 +142,12 @@ class TestGenerateToolDescription:
 class TestShouldIncludeOperation:
     """Test suite for operation filtering"""
 
-    def _op(self, path="/api/v1/test", method="GET", extensions=None):
+    def _op(self, path="/api/v1/test", method="GET", extensions=None, deprecated=False):
         return Operation(
             path=path, method=method, operation_id="test",
             summary=None, description=None, parameters=[],
             request_body=None, responses={}, tags=[],
+            deprecated=deprecated,
             extensions=extensions or {},
         )
 
@@ -157,8 +158,8 @@ class TestShouldIncludeOperation:
         assert should_include_operation(self._op(extensions={"x-mcp-expose": True})) is True
 
     def test_excluded_when_deprecated(self):
-        op = self._op(extensions={"x-mcp-expose": True})
-        op.deprecated = True
+        # Operation is frozen — the flag is set at construction.
+        op = self._op(extensions={"x-mcp-expose": True}, deprecated=True)
         assert should_include_operation(op) is False
 
 
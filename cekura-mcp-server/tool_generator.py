@@ -1,12 +1,14 @@
 from typing import Dict, Any, Optional
 from openapi_parser import Operation
 from mcp.types import ToolAnnotations
+import functools
 import re
-import json
 import sys
 import hashlib
 from pathlib import Path
 
+import orjson
+
 
 # POST endpoints whose final path segment marks them as destructive even though
 # they aren't DELETE. These remove or terminate things server-side.
@@ -24,7 +26,8 @@ def compute_annotations(operation: Operation) -> ToolAnnotations:
         POST (other)  → readOnlyHint=False, destructiveHint=False
         PUT, PATCH    → readOnlyHint=False, destructiveHint=False
     """
-    method = operation.method.upper()
+    # Operation.method is normalized to uppercase at construction.
+    method = operation.method
     read_only = (method == 'GET')
 
     explicit = (operation.extensions or {}).get('x-mcp-destructive')
@@ -45,29 +48,37 @@ def compute_annotations(operation: Operation) -> ToolAnnotations:
     return ToolAnnotations(readOnlyHint=False, destructiveHint=False)
 
 
+_OVERLAY_PATH = Path(__file__).parent / 'mcp_tools.json'
 _OVERLAY_CACHE: Optional[Dict[str, Any]] = None
+_OVERLAY_MTIME_NS: Optional[int] = None
 
 
 def load_tool_overlays() -> Dict[str, Any]:
-    """Load per-tool MCP enrichments. Cached on first call."""
-    global _OVERLAY_CACHE
-    if _OVERLAY_CACHE is not None:
+    """Load per-tool MCP enrichments.
+
+    Cached and invalidated on the overlay file's mtime, so repeated callers
+    pay one stat per call and an edited mcp_tools.json is picked up without a
+    process restart.
+    """
+    global _OVERLAY_CACHE, _OVERLAY_MTIME_NS
+
+    try:
+        mtime_ns = _OVERLAY_PATH.stat().st_mtime_ns
+    except OSError:
+        _OVERLAY_CACHE, _OVERLAY_MTIME_NS = {}, None
         return _OVERLAY_CACHE
 
-    overlay_file = Path(__file__).parent / 'mcp_tools.json'
-    if not overlay_file.exists():
-        _OVERLAY_CACHE = {}
+    if _OVERLAY_CACHE is not None and mtime_ns == _OVERLAY_MTIME_NS:
         return _OVERLAY_CACHE
 
     try:
-        with open(overlay_file, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(_OVERLAY_PATH.read_bytes())
         _OVERLAY_CACHE = {k: v for k, v in data.items() if not k.startswith('_')}
-        return _OVERLAY_CACHE
     except Exception as e:
         print(f"Error loading mcp_tools.json: {e}", file=sys.stderr)
         _OVERLAY_CACHE = {}
-        return _OVERLAY_CACHE
+    _OVERLAY_MTIME_NS = mtime_ns
+    return _OVERLAY_CACHE
 
 
 def apply_overlay_to_description(tool_name: str, description: str) -> str:
@@ -182,30 +193,58 @@ def _global_max_examples_per_tool() -> int:
 # trailers match.
 _COLLISION_SUFFIX = re.compile(r"_\d+$")
 
+# Path → slug in one C-level pass instead of a replace() chain
+# (each replace() rescans and reallocates the whole string).
+_PATH_SLUG_TRANS = str.maketrans({'/': '_', '{': None, '}': None})
 
-def generate_tool_name(operation: Operation) -> str:
-    """Convert an OpenAPI operationId into an MCP tool name."""
-    MAX_TOOL_NAME_LENGTH = 64
+# Compiled once — generate_tool_name runs per operation on every spec load.
+_NAME_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
 
-    if operation.operation_id:
-        name = operation.operation_id.replace("-", "_")
-        name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+_MAX_TOOL_NAME_LENGTH = 64
+_HASH_SUFFIX_HEX_LEN = 8  # blake2b digest_size=4 → 8 hex chars
+_MAX_PREFIX_LENGTH = _MAX_TOOL_NAME_LENGTH - _HASH_SUFFIX_HEX_LEN - 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _tool_name_from_parts(operation_id: Optional[str], method: str, path: str) -> str:
+    if operation_id:
+        name = operation_id.replace("-", "_")
+        # Most names are already clean; sub() always allocates a new string,
+        # so only invoke it when a scan finds something to strip.
+        if _NAME_SANITIZE_RE.search(name):
+            name = _NAME_SANITIZE_RE.sub('', name)
     else:
-        path_slug = operation.path.strip("/").replace("/", "_").replace("{", "").replace("}", "")
-        path_slug = re.sub(r'[^a-zA-Z0-9_]', '', path_slug)
-        method_name = operation.method.lower()
+        path_slug = path.strip("/").translate(_PATH_SLUG_TRANS)
+        if _NAME_SANITIZE_RE.search(path_slug):
+            path_slug = _NAME_SANITIZE_RE.sub('', path_slug)
+        method_name = method.lower()
         name = f"{method_name}_{path_slug}"
 
     name = _COLLISION_SUFFIX.sub("", name)
 
-    if len(name) > MAX_TOOL_NAME_LENGTH:
-        hash_suffix = hashlib.md5(name.encode()).hexdigest()[:8]
-        max_prefix_length = MAX_TOOL_NAME_LENGTH - len(hash_suffix) - 1
-        name = f"{name[:max_prefix_length]}_{hash_suffix}"
+    if len(name) > _MAX_TOOL_NAME_LENGTH:
+        # blake2b sized to the 8 hex chars we keep — no OpenSSL init and no
+        # 32-char digest allocated just to slice its head (the suffix is
+        # only collision avoidance, not cryptographic).
+        # The sanitizer above guarantees [A-Za-z0-9_], so the ASCII encoder's
+        # memcpy fast path applies.
+        name = (
+            f"{name[:_MAX_PREFIX_LENGTH]}"
+            f"_{hashlib.blake2b(name.encode('ascii'), digest_size=4).hexdigest()}"
+        )
 
     return name
 
 
+def generate_tool_name(operation: Operation) -> str:
+    """Convert an OpenAPI operationId into an MCP tool name.
+
+    Memoized on (operation_id, method, path): the server, the overlay
+    validator, and the tests all regenerate names for the same operations.
+    """
+    return _tool_name_from_parts(operation.operation_id, operation.method, operation.path)
+
+
 # Human-readable tool titles (MCP spec 2025-06-18 `Tool.title`). Directory
 # reviewers (e.g. the Anthropic Connectors Directory) require every tool to
 # carry one. Precedence: the operation's OpenAPI `summary` (the backend is
@@ -336,18 +375,30 @@ def _truncate_sentence_aware(desc: str, limit: int) -> str:
     return head + "..."
 
 
-def generate_tool_description(operation: Operation) -> str:
-    if operation.description:
-        return _truncate_sentence_aware(operation.description.strip(), MAX_DESCRIPTION_LENGTH)
+@functools.lru_cache(maxsize=4096)
+def _description_from_parts(
+    description: Optional[str],
+    summary: Optional[str],
+    method: str,
+    path: str,
+) -> str:
+    if description:
+        return _truncate_sentence_aware(description.strip(), MAX_DESCRIPTION_LENGTH)
 
-    if operation.summary:
-        return _truncate_sentence_aware(operation.summary.strip(), MAX_DESCRIPTION_LENGTH)
+    if summary:
+        return _truncate_sentence_aware(summary.strip(), MAX_DESCRIPTION_LENGTH)
 
-    method = operation.method.upper()
-    path = operation.path
     return f"{method} {path}"
 
 
+def generate_tool_description(operation: Operation) -> str:
+    # Memoized like generate_tool_name — the truncation scan is the
+    # expensive part and its inputs repeat across callers.
+    return _description_from_parts(
+        operation.description, operation.summary, operation.method, operation.path
+    )
+
+
 # Shared hint appended to any tool whose input schema accepts an organization
 # or project reference. Edit here once; every applicable tool picks it up.
 # Tools can opt out via the overlay flag `suppress_org_project_hint: true`.
@@ -386,6 +437,13 @@ def build_input_schema(operation: Operation, parser: Any) -> Dict[str, Any]:
 
 
 def should_include_operation(operation: Operation) -> bool:
-    if operation.deprecated:
+    # Most spec operations are not exposed; test the selective condition
+    # first so the common case exits after one dict probe.
+    if not (operation.extensions or {}).get('x-mcp-expose'):
         return False
-    return bool((operation.extensions or {}).get('x-mcp-expose'))
+    return not operation.deprecated
+
+
+def filter_operations(operations: list) -> list:
+    """Return only the operations exposed as MCP tools, in spec order."""
+    return [op for op in operations if should_include_operation(op)]
@@ -10,7 +10,6 @@ startup path for non-fatal drift warnings).
 """
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
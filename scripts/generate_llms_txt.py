@@ -14,7 +14,6 @@ Usage:
 import argparse
 import json
 import os
-import re
 import sys
 
 DOCS_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -69,31 +68,53 @@ API_GROUP_DESCRIPTIONS = {
 
 
 def load_mint_json() -> dict:
-    with open(MINT_JSON_PATH) as f:
-        return json.load(f)
+    # Binary read + loads: no universal-newline text decoding pass.
+    with open(MINT_JSON_PATH, "rb") as f:
+        return json.loads(f.read())
+
+
+# The only frontmatter keys llms.txt cares about; set membership is one
+# hash probe per line instead of up to three string compares.
+FRONTMATTER_KEYS = frozenset({"title", "description", "sidebarTitle"})
 
 
 def extract_frontmatter(content: str) -> dict:
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    # Manual fence scan (see scripts/sync_descriptions.py) — two find() calls
+    # instead of a DOTALL regex over the whole file.
+    if not content.startswith("---"):
+        return {}
+    open_end = content.find("\n")
+    if open_end == -1 or content[3:open_end].strip():
+        return {}
+    close_start = content.find("\n---", open_end)
+    if close_start == -1:
         return {}
     fm = {}
-    for line in match.group(1).split("\n"):
+    for line in content[open_end + 1:close_start].split("\n"):
         if ":" in line:
             key, _, value = line.partition(":")
             key = key.strip()
             value = value.strip().strip('"').strip("'")
-            if key in ("title", "description", "sidebarTitle"):
+            if key in FRONTMATTER_KEYS:
                 fm[key] = value
     return fm
 
 
+def _read_head(path: str, n: int = 65536) -> bytes:
+    # Frontmatter always sits in the first block; one raw read avoids the
+    # TextIOWrapper setup and full-file decode of open().read() per page.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
+
+
 def read_page_meta(page_path: str) -> dict:
     for ext in (".mdx", ".md", ""):
         full_path = os.path.join(DOCS_ROOT, page_path + ext)
         if os.path.exists(full_path):
-            with open(full_path) as f:
-                return extract_frontmatter(f.read())
+            return extract_frontmatter(_read_head(full_path).decode("utf-8", "replace"))
     return {}
 
 
@@ -113,13 +134,20 @@ def format_entry(page_path: str, meta: dict) -> str:
 
 
 def collect_pages(pages_list: list) -> list[tuple[str, dict]]:
+    # Iterative depth-first walk with a stack of iterators: no recursion
+    # limit on deeply nested groups, no per-level frame setup, and entries
+    # come out in the same document order as the recursive version.
     results = []
-    for item in pages_list:
-        if isinstance(item, str):
-            meta = read_page_meta(item)
-            results.append((item, meta))
-        elif isinstance(item, dict) and "pages" in item:
-            results.extend(collect_pages(item["pages"]))
+    stack = [iter(pages_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, str):
+                results.append((item, read_page_meta(item)))
+            elif isinstance(item, dict) and "pages" in item:
+                stack.append(iter(item["pages"]))
+                break
+        else:
+            stack.pop()
     return results
 
 